@@ -1,28 +1,132 @@
 import argparse
+import functools
+import os
 import subprocess
 import shutil
 from pathlib import Path
 
+# Passed on every run; -nostdin keeps ffmpeg from blocking on prompts
+BASE_FLAGS = ["-hide_banner", "-nostdin"]
 
+# Keep ffmpeg silent unless something goes wrong; dropped with ``verbose``
+QUIET_FLAGS = ["-loglevel", "error", "-nostats"]
+
+# Python's own fds are non-inheritable, so on POSIX there is nothing for
+# close_fds to do and leaving it off lets subprocess use posix_spawn. Windows
+# still needs it to keep parallel ffmpeg runs from inheriting each other's pipes.
+CLOSE_FDS = os.name != "posix"
+
+# Explicit encoders for codec names that are not ffmpeg encoder names
+ENCODERS = {"mp3": "libmp3lame", "wav": "pcm_s16le"}
+
+# Arguments written before every output file; the None slots are filled in by
+# _output_args(). Tune per-output ffmpeg flags here.
+OUTPUT_ARGS_TEMPLATE = ("-vn", "-acodec", None, "-threads", None, None)
+_IDX_CODEC, _IDX_THREADS, _IDX_OUTPUT = 2, 4, 5
+
+
+def _find_local_ffmpeg(directory: Path) -> str | None:
+    """Look for ffmpeg in ``directory``, ``directory/ffmpeg`` or ``directory/ffmpeg/bin``.
+
+    Each directory is listed once with :func:`os.scandir` rather than probing
+    every candidate path separately.
+    """
+    for subdir in ("ffmpeg", "bin", None):
+        try:
+            with os.scandir(directory) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            return None
+        for name in ("ffmpeg", "ffmpeg.exe"):
+            entry = entries.get(name)
+            if entry is not None and entry.is_file():
+                return entry.path
+        entry = entries.get(subdir) if subdir else None
+        if entry is None or not entry.is_dir():
+            return None
+        directory = Path(entry.path)
+    return None
+
+@functools.lru_cache(maxsize=1)
 def find_ffmpeg() -> str:
-    """Return path to ffmpeg executable preferring a local copy."""
-    local = Path(__file__).with_name("ffmpeg")
-    if local.exists():
-        return str(local.resolve())
+    """Return path to ffmpeg executable preferring a local copy.
+
+    The result is cached for the life of the process; call
+    ``find_ffmpeg.cache_clear()`` to force a new search.
+    """
+    local = _find_local_ffmpeg(Path(__file__).resolve().parent)
+    if local:
+        return local
     ffmpeg = shutil.which("ffmpeg")
     if ffmpeg:
         return ffmpeg
     raise FileNotFoundError("ffmpeg executable not found")
 
+def _tail(output: bytes, limit: int = 4096) -> str:
+    """Decode the last ``limit`` bytes of ffmpeg output for error messages."""
+    return output[-limit:].decode("utf-8", errors="replace")
+
+def _read_tail(path: Path, limit: int = 4096) -> bytes:
+    """Return the last ``limit`` bytes of ``path`` without reading the rest."""
+    with open(path, "rb") as fh:
+        fh.seek(max(0, os.fstat(fh.fileno()).st_size - limit))
+        return fh.read()
+
+def _output_args(output_file: Path, codec: str, threads: int) -> list[str]:
+    """Return the ffmpeg arguments that produce ``output_file``."""
+    args = list(OUTPUT_ARGS_TEMPLATE)
+    args[_IDX_CODEC] = ENCODERS.get(codec, codec)
+    args[_IDX_THREADS] = str(threads)
+    args[_IDX_OUTPUT] = str(output_file)
+    return args
+
+def _run_ffmpeg(cmd: list[str], log_files: list[Path], verbose: bool) -> bytes:
+    """Run ffmpeg, saving its output to ``log_files`` if verbose or on failure.
+
+    A quiet run that succeeds removes any existing ``log_files``.
+    """
+    if verbose:
+        # Verbose logs can be large; let ffmpeg write straight to disk rather
+        # than piping everything through Python.
+        with open(log_files[0], "wb") as fh:
+            returncode = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=fh, close_fds=CLOSE_FDS).returncode
+        for log_file in log_files[1:]:
+            shutil.copyfile(log_files[0], log_file)
+        # The full log stays on disk; only read back what an error message needs
+        output = _read_tail(log_files[0]) if returncode != 0 else b""
+    else:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=CLOSE_FDS,
+        )
+        returncode, output = result.returncode, result.stderr
+        for log_file in log_files:
+            if returncode != 0:
+                log_file.write_bytes(output)
+            else:
+                # Don't leave an earlier run's error log next to a good output
+                log_file.unlink(missing_ok=True)
+
+    if returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {_tail(output)}")
+
+    return output
+
 def extract_audio(
     input_file: Path,
     output_file: Path,
     codec: str = "mp3",
     ffmpeg_path: str | Path | None = None,
     log_file: Path | None = None,
-) -> str:
+    verbose: bool = False,
+    threads: int = 0,
+) -> bytes:
     """Extract audio from a video or audio file using ffmpeg.
 
+    Only the first audio stream of ``input_file`` is extracted.
+
     Parameters
     ----------
     input_file: Path
@@ -36,12 +140,20 @@ def extract_audio(
         :func:`find_ffmpeg`.
     log_file: Path | None
         Path to a file where ffmpeg output will be written. Defaults to a ``.txt``
-        file alongside ``output_file``.
+        file alongside ``output_file``. Only written on failure unless
+        ``verbose`` is set.
+    verbose: bool
+        Run ffmpeg at its default log level and write its output directly to
+        the log file.
+    threads: int
+        Encoder thread count passed to ffmpeg; ``0`` lets ffmpeg pick.
 
     Returns
     -------
-    str
-        ffmpeg's combined standard output and error.
+    bytes
+        ffmpeg's raw standard error. Empty on success unless something was
+        logged; always empty with ``verbose``, where the output goes straight
+        to the log file instead.
     """
     if not input_file.exists():
         raise FileNotFoundError(f"Input file {input_file} does not exist")
@@ -51,25 +163,72 @@ def extract_audio(
     if log_file is None:
         log_file = output_file.with_suffix(".txt")
 
-    cmd = [
-        ffmpeg,
-        "-i",
-        str(input_file),
-        "-vn",
-        "-acodec",
-        codec,
-        str(output_file),
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    cmd = [ffmpeg, *BASE_FLAGS, *([] if verbose else QUIET_FLAGS), "-i", str(input_file)]
+    # Same stream choice as extract_audio_batch() so both paths agree
+    cmd += ["-map", "0:a:0", *_output_args(output_file, codec, threads)]
+    return _run_ffmpeg(cmd, [log_file], verbose)
+
+def extract_audio_batch(
+    input_files: list[Path],
+    output_files: list[Path],
+    codec: str = "mp3",
+    ffmpeg_path: str | Path | None = None,
+    log_files: list[Path] | None = None,
+    verbose: bool = False,
+    threads: int = 0,
+) -> bytes:
+    """Extract audio from several files with a single ffmpeg process.
 
-    with open(log_file, "w", encoding="utf-8") as fh:
-        fh.write(result.stdout)
-        fh.write(result.stderr)
+    Each input is opened with its own ``-i`` and its first audio stream is
+    mapped to the output at the same position, so ffmpeg startup is paid once
+    for the whole batch.
 
-    if result.returncode != 0:
-        raise RuntimeError(f"ffmpeg failed: {result.stderr}")
+    Parameters
+    ----------
+    input_files: list[Path]
+        Source files to extract from.
+    output_files: list[Path]
+        Resulting audio files, one per input.
+    codec: str
+        Audio codec to use.
+    ffmpeg_path: str | Path | None
+        Optional explicit path to ffmpeg. If ``None`` a search is performed via
+        :func:`find_ffmpeg`.
+    log_files: list[Path] | None
+        Files where the shared ffmpeg output will be written. Defaults to a
+        ``.txt`` file alongside each output file. Only written on failure
+        unless ``verbose`` is set.
+    verbose: bool
+        Run ffmpeg at its default log level and write its output directly to
+        the log files.
+    threads: int
+        Encoder thread count passed to ffmpeg; ``0`` lets ffmpeg pick.
 
-    return result.stdout + result.stderr
+    Returns
+    -------
+    bytes
+        ffmpeg's raw standard error. Empty on success unless something was
+        logged; always empty with ``verbose``, where the output goes straight
+        to the log file instead.
+    """
+    if len(input_files) != len(output_files):
+        raise ValueError("input_files and output_files must have the same length")
+    for input_file in input_files:
+        if not input_file.exists():
+            raise FileNotFoundError(f"Input file {input_file} does not exist")
+
+    ffmpeg = str(ffmpeg_path or find_ffmpeg())
+
+    if log_files is None:
+        log_files = [output_file.with_suffix(".txt") for output_file in output_files]
+
+    cmd = [ffmpeg, *BASE_FLAGS, *([] if verbose else QUIET_FLAGS)]
+    for input_file in input_files:
+        cmd += ["-i", str(input_file)]
+    for index, output_file in enumerate(output_files):
+        # Only the first audio track; mp3 and wav hold a single stream
+        cmd += ["-map", f"{index}:a:0", *_output_args(output_file, codec, threads)]
+    return _run_ffmpeg(cmd, log_files, verbose)
 
 def main(argv=None):
     parser = argparse.ArgumentParser(description="Extract audio from video files")
@@ -85,6 +244,17 @@ def main(argv=None):
         type=Path,
         help="Directory to place output file (default: same as input)",
     )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=0,
+        help="Encoder threads for ffmpeg (default: 0, chosen by ffmpeg)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Write full ffmpeg output to the .txt log, even on success",
+    )
     args = parser.parse_args(argv)
 
     if args.output and args.output_dir:
@@ -96,7 +266,17 @@ def main(argv=None):
         directory = args.output_dir or args.input.parent
         output_file = directory / f"{args.input.stem}.{args.codec}"
 
-    extract_audio(args.input, output_file, args.codec)
+    log_file = output_file.with_suffix(".txt")
+    extract_audio(
+        args.input,
+        output_file,
+        args.codec,
+        log_file=log_file,
+        verbose=args.verbose,
+        threads=args.threads,
+    )
+    if args.verbose:
+        print(f"ffmpeg log written to {log_file}")
 
 if __name__ == "__main__":
     main()
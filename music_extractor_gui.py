@@ -1,12 +1,188 @@
+import multiprocessing
+import multiprocessing.queues
+import os
+import statistics
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
 
-from extract_audio import extract_audio, find_ffmpeg
+from extract_audio import extract_audio, extract_audio_batch, find_ffmpeg
+
+# Batches whose median input is smaller than this are extracted with one ffmpeg
+# process per worker instead of one per file, since startup dominates.
+SMALL_FILE_BYTES = 50 * 1024 * 1024
+
+# Most files handed to one batched ffmpeg, keeping its open files, command
+# line and time to first "Finished" message bounded.
+BATCH_SIZE = 16
+
+# How many tasks (single files or batches) to warm into the OS cache ahead of
+# the running ones, and how much of each input to read ahead.
+PREFETCH_AHEAD = 2
+PREFETCH_BYTES = 8 * 1024 * 1024
+
+# Lines kept in the log window before the oldest are discarded
+MAX_LOG_LINES = 10000
+
+# Maximum number of log messages waiting for the GUI
+LOG_QUEUE_SIZE = 4096
+
+# Start the worker fresh rather than forking the running Tk process, and the
+# same way on every OS.
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def _prefetch(path: Path) -> None:
+    """Ask the OS to start reading the first ``PREFETCH_BYTES`` of ``path`` into the page cache."""
+    try:
+        with open(path, "rb") as fh:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fh.fileno(), 0, PREFETCH_BYTES, os.POSIX_FADV_WILLNEED)
+            else:
+                remaining = PREFETCH_BYTES
+                while remaining > 0 and fh.read(min(remaining, 1024 * 1024)):
+                    remaining -= 1024 * 1024
+    except OSError:
+        pass
+
+
+def _run_extraction_worker(
+    input_files: list[str],
+    output_dir: str | None,
+    codec: str,
+    ffmpeg_path: str,
+    max_workers: int,
+    log_queue: multiprocessing.queues.Queue,
+) -> None:
+    """Extract every input file, reporting progress on ``log_queue``.
+
+    Runs in its own process so handling ffmpeg output never competes with the
+    Tk main loop for the GIL.
+    """
+    jobs: list[tuple[Path, Path, Path]] = []
+    claimed: dict[str, Path] = {}
+    for input_path in input_files:
+        in_path = Path(input_path)
+        out_dir = Path(output_dir) if output_dir else in_path.parent
+        output_file = out_dir / f"{in_path.stem}.{codec}"
+        # Inputs sharing a stem would have parallel ffmpeg runs writing one file
+        key = os.path.normcase(output_file.resolve())
+        if key in claimed:
+            log_queue.put(f"Error processing {in_path}: {output_file} is already the output for {claimed[key]}\n")
+            continue
+        claimed[key] = in_path
+        jobs.append((in_path, output_file, output_file.with_suffix(".txt")))
+    if not jobs:
+        log_queue.put("DONE")
+        return
+
+    # Bound concurrency so a large selection doesn't spawn one ffmpeg per file
+    workers = min(max_workers, len(jobs))
+    if len(jobs) > 1 and _median_size(jobs) < SMALL_FILE_BYTES:
+        # Spread the files over the workers, but never past BATCH_SIZE per run
+        size = min(BATCH_SIZE, -(-len(jobs) // workers))
+        tasks = [(_extract_batch, jobs[i:i + size]) for i in range(0, len(jobs), size)]
+    else:
+        tasks = [(_extract_files, [job]) for job in jobs]
+    # Warm upcoming inputs while ffmpeg works on the current ones. Slots are
+    # counted per task, since a batch's files are all opened at once.
+    ahead = threading.Semaphore(workers + PREFETCH_AHEAD)
+    threading.Thread(
+        target=_prefetch_inputs,
+        args=([[in_path for in_path, _, _ in chunk] for _, chunk in tasks], ahead),
+        daemon=True,
+    ).start()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(func, chunk, codec, ffmpeg_path, log_queue): chunk for func, chunk in tasks}
+        for future in as_completed(futures):
+            ahead.release()
+            for in_path, error in future.result():
+                if error is None:
+                    log_queue.put(f"Finished {in_path}\n")
+                else:
+                    log_queue.put(f"Error processing {in_path}: {error}\n")
+    log_queue.put("DONE")
+
+
+def _prefetch_inputs(chunks: list[list[Path]], ahead: threading.Semaphore) -> None:
+    for chunk in chunks:
+        ahead.acquire()
+        for path in chunk:
+            _prefetch(path)
+
+
+def _tag_lines(output: bytes, label: str) -> bytes:
+    """Prefix each line of ``output`` with ``label`` so parallel jobs stay readable."""
+    prefix = f"[{label}] ".encode()
+    return b"".join(prefix + line for line in output.splitlines(keepends=True))
+
+
+def _median_size(jobs: list[tuple[Path, Path, Path]]) -> float:
+    sizes = []
+    for in_path, _, _ in jobs:
+        try:
+            sizes.append(in_path.stat().st_size)
+        except OSError:
+            sizes.append(0)
+    return statistics.median(sizes)
+
+
+def _extract_batch(
+    jobs: list[tuple[Path, Path, Path]],
+    codec: str,
+    ffmpeg_path: str,
+    log_queue: multiprocessing.queues.Queue,
+) -> list[tuple[Path, Exception | None]]:
+    if len(jobs) == 1:
+        return _extract_files(jobs, codec, ffmpeg_path, log_queue)
+    inputs, outputs, logs = (list(column) for column in zip(*jobs))
+    for in_path, output_file in zip(inputs, outputs):
+        log_queue.put(f"Extracting {in_path} -> {output_file}\n")
+    existing = {output_file for output_file in outputs if output_file.exists()}
+    try:
+        output = extract_audio_batch(inputs, outputs, codec, ffmpeg_path=ffmpeg_path, log_files=logs)
+    except Exception as exc:
+        # One bad input fails the whole ffmpeg run; retry individually so
+        # the remaining files still get extracted. ffmpeg may already have
+        # created some outputs, which would make the retries refuse to
+        # overwrite them, and the shared failure log belongs to no single file.
+        log_queue.put(f"Batch extraction failed ({exc}), retrying files individually\n")
+        for output_file, log_file in zip(outputs, logs):
+            if output_file not in existing:
+                output_file.unlink(missing_ok=True)
+            log_file.unlink(missing_ok=True)
+        results = []
+        for job in jobs:
+            results += _extract_files([job], codec, ffmpeg_path, log_queue)
+        return results
+    if output:
+        log_queue.put(_tag_lines(output, ", ".join(in_path.name for in_path in inputs)))
+    return [(in_path, None) for in_path in inputs]
+
+
+def _extract_files(
+    jobs: list[tuple[Path, Path, Path]],
+    codec: str,
+    ffmpeg_path: str,
+    log_queue: multiprocessing.queues.Queue,
+) -> list[tuple[Path, Exception | None]]:
+    results = []
+    for in_path, output_file, log_file in jobs:
+        log_queue.put(f"Extracting {in_path} -> {output_file}\n")
+        try:
+            output = extract_audio(in_path, output_file, codec, ffmpeg_path=ffmpeg_path, log_file=log_file)
+        except Exception as exc:
+            results.append((in_path, exc))
+            continue
+        if output:
+            log_queue.put(_tag_lines(output, in_path.name))
+        results.append((in_path, None))
+    return results
 
 
 class ExtractorGUI:
@@ -23,13 +199,19 @@ class ExtractorGUI:
         # Output format variable (mp3 or wav)
         self.format_var = tk.StringVar(value="mp3")
 
+        # Number of files extracted concurrently
+        self.max_workers = os.cpu_count() or 1
+        self.workers_var = tk.IntVar(value=self.max_workers)
+
         # Build UI
         self._build_widgets()
 
-        # Queue for logging messages from worker thread
-        self.log_queue: queue.Queue[str] = queue.Queue()
-        # Thread handle
-        self.worker: threading.Thread | None = None
+        # Queue for logging messages from the worker process. ffmpeg output
+        # arrives as raw bytes and is decoded on the GUI side. Bounded so the
+        # worker blocks instead of piling up output the GUI hasn't shown yet.
+        self.log_queue: multiprocessing.queues.Queue = _MP_CONTEXT.Queue(maxsize=LOG_QUEUE_SIZE)
+        # Worker process handle
+        self.worker: multiprocessing.process.BaseProcess | None = None
 
         # Periodic check for new log messages
         self.master.after(100, self._process_queue)
@@ -50,6 +232,11 @@ class ExtractorGUI:
         tk.Radiobutton(format_frame, text="MP3", variable=self.format_var, value="mp3").pack(side=tk.LEFT)
         tk.Radiobutton(format_frame, text="WAV", variable=self.format_var, value="wav").pack(side=tk.LEFT)
 
+        workers_frame = tk.Frame(self.master)
+        workers_frame.pack(padx=10, anchor="w")
+        tk.Label(workers_frame, text="Parallel Jobs:").pack(side=tk.LEFT)
+        tk.Spinbox(workers_frame, from_=1, to=64, width=4, textvariable=self.workers_var).pack(side=tk.LEFT)
+
         self.run_btn = tk.Button(self.master, text="Run Extraction", command=self.start_extraction)
         self.run_btn.pack(padx=10, pady=5)
 
@@ -80,44 +267,73 @@ class ExtractorGUI:
                 "FFmpeg is required but was not found.",
             )
             return
+        try:
+            self.max_workers = max(1, self.workers_var.get())
+        except tk.TclError:
+            self.workers_var.set(self.max_workers)
 
         # Disable buttons during extraction
         self._set_buttons_state(tk.DISABLED)
 
-        self.worker = threading.Thread(target=self._run_extraction_thread, daemon=True)
-        self.worker.start()
-
-    def _run_extraction_thread(self) -> None:
-        for input_path in self.input_files:
-            in_path = Path(input_path)
-            out_dir = Path(self.output_dir) if self.output_dir else in_path.parent
-            output_file = out_dir / f"{in_path.stem}.{self.format_var.get()}"
-            log_file = output_file.with_suffix(".txt")
-            self.log_queue.put(f"Extracting {in_path} -> {output_file}\n")
-            try:
-                output = extract_audio(in_path, output_file, self.format_var.get(), ffmpeg_path=self.ffmpeg_path, log_file=log_file)
-                self.log_queue.put(output)
-                self.log_queue.put(f"Finished {input_path}\n")
-            except Exception as exc:
-                self.log_queue.put(f"Error processing {input_path}: {exc}\n")
-        self.log_queue.put("DONE")
+        self.worker = _MP_CONTEXT.Process(
+            target=_run_extraction_worker,
+            args=(
+                list(self.input_files),
+                self.output_dir,
+                self.format_var.get(),
+                self.ffmpeg_path,
+                self.max_workers,
+                self.log_queue,
+            ),
+            daemon=True,
+        )
+        try:
+            self.worker.start()
+        except Exception as exc:
+            self.worker = None
+            self._append_log(f"Could not start extraction: {exc}\n")
+            self._set_buttons_state(tk.NORMAL)
 
     def _process_queue(self) -> None:
+        # Checked before draining: a worker that exited normally has already
+        # flushed DONE into the queue, so a dead worker left over after the
+        # drain crashed or was killed.
+        worker_exited = self.worker is not None and not self.worker.is_alive()
+        # Drain everything queued since the last tick and insert it in one go
+        batch: list[str] = []
         while True:
             try:
                 msg = self.log_queue.get_nowait()
             except queue.Empty:
                 break
             if msg == "DONE":
+                self._append_log("".join(batch))
+                batch.clear()
+                self.worker.join()
+                self.worker = None
                 self._set_buttons_state(tk.NORMAL)
                 messagebox.showinfo("Extraction Complete", "Processing finished. Check log for details.")
+            elif isinstance(msg, bytes):
+                batch.append(msg.decode("utf-8", errors="replace"))
             else:
-                self._append_log(msg)
+                batch.append(msg)
+        self._append_log("".join(batch))
+        if worker_exited and self.worker is not None:
+            exitcode = self.worker.exitcode
+            self.worker = None
+            self._append_log(f"Extraction worker stopped unexpectedly (exit code {exitcode}).\n")
+            self._set_buttons_state(tk.NORMAL)
         self.master.after(100, self._process_queue)
 
     def _append_log(self, text: str) -> None:
+        if not text:
+            return
         self.log_text.configure(state="normal")
         self.log_text.insert(tk.END, text)
+        # Drop the oldest lines so the widget stays responsive on long runs
+        lines = int(self.log_text.index("end-1c").split(".")[0])
+        if lines > MAX_LOG_LINES:
+            self.log_text.delete("1.0", f"{lines - MAX_LOG_LINES + 1}.0")
         self.log_text.see(tk.END)
         self.log_text.configure(state="disabled")
 